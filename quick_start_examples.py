@@ -6,33 +6,80 @@ This file demonstrates how to use individual functions from the main script
 for specific analysis tasks.
 """
 
+import hashlib
+import os
+import pickle
+import traceback
+
+import numpy as np
 import pandas as pd
+import pm4py
 from process_mining_aruba import (
+    CACHE_DIR,
     load_aruba_data,
     preprocess_data,
+    load_preprocessed_data,
     create_event_log,
-    convert_to_pm4py_log,
     discover_process_inductive_miner,
     visualize_petri_net,
-    analyze_activity_frequency
+    analyze_activity_frequency,
+    top_counts
 )
 
+# Raw sample sizes used by the examples below. Each example also accepts an
+# already loaded raw frame (df) and then uses its first rows instead of
+# loading the file itself.
+EXAMPLE_SAMPLE_SIZES = (10000, 20000, 30000, 50000)
+
+# Preprocessed samples shared by the examples, keyed by file and settings
+_PREPPED_CACHE = {}
+_PREPPED_SOURCES = {}
+
+
+def get_prepped(sample_size, remove_duplicates=True, time_threshold_seconds=1,
+                filepath='aruba.csv', df=None):
+    """
+    Load and preprocess a sample once per session.
+    
+    The first request for a given sample size and preprocessing settings goes
+    through load_preprocessed_data() (which also reuses its Parquet cache
+    between runs); later requests reuse the in-memory result. A copy is
+    returned so examples can add columns without affecting each other.
+    
+    If a raw frame from load_aruba_data() is given as df, its first
+    sample_size rows are preprocessed instead of reading the file, again once
+    per frame and settings.
+    """
+    source = filepath if df is None else id(df)
+    key = (source, sample_size, remove_duplicates, time_threshold_seconds)
+    if key not in _PREPPED_CACHE:
+        if df is None:
+            _PREPPED_CACHE[key] = load_preprocessed_data(
+                filepath, sample_size=sample_size, remove_duplicates=remove_duplicates,
+                time_threshold_seconds=time_threshold_seconds)
+        else:
+            # Hold on to the raw frame so its id() cannot be reused by another
+            # frame while entries keyed on it exist
+            _PREPPED_SOURCES[id(df)] = df
+            _PREPPED_CACHE[key] = preprocess_data(
+                df.head(sample_size), remove_duplicates=remove_duplicates,
+                time_threshold_seconds=time_threshold_seconds)
+    return _PREPPED_CACHE[key].copy()
+
+
 # ============================================================
 # Example 1: Quick Analysis with Small Sample
 # ============================================================
 
-def quick_analysis():
+def quick_analysis(df=None):
     """
     Perform a quick analysis on a small sample for testing.
     """
     print("Example 1: Quick Analysis")
     print("-" * 60)
     
-    # Load small sample (10,000 events)
-    df = load_aruba_data('aruba.csv', sample_size=10000)
-    
-    # Preprocess
-    df_clean = preprocess_data(df, remove_duplicates=True, time_threshold_seconds=1)
+    # Load and preprocess small sample (10,000 events)
+    df_clean = get_prepped(10000, remove_duplicates=True, time_threshold_seconds=1, df=df)
     
     # Create event log with daily cases
     event_log_df = create_event_log(df_clean, case_strategy='daily')
@@ -51,7 +98,7 @@ def quick_analysis():
 # Example 2: Session-Based Analysis
 # ============================================================
 
-def session_based_analysis():
+def session_based_analysis(df=None):
     """
     Analyze smart home data using session-based cases instead of daily.
     Sessions are separated by 2-hour gaps (likely sleep periods).
@@ -59,17 +106,17 @@ def session_based_analysis():
     print("\nExample 2: Session-Based Analysis")
     print("-" * 60)
     
-    # Load sample
-    df = load_aruba_data('aruba.csv', sample_size=20000)
-    
-    # Preprocess
-    df_clean = preprocess_data(df)
+    # Load and preprocess sample
+    df_clean = get_prepped(20000, df=df)
     
     # Create event log with session-based cases
     event_log_df = create_event_log(df_clean, case_strategy='session')
     
     print(f"\nSession Statistics:")
-    session_lengths = event_log_df.groupby('case_id').size()
+    # The event log is sorted by case, so session lengths are the distances
+    # between the positions where the case code changes
+    case_codes = event_log_df['case_id'].cat.codes.to_numpy()
+    session_lengths = np.diff(np.flatnonzero(np.r_[True, case_codes[1:] != case_codes[:-1], True]))
     print(f"  Total sessions: {len(session_lengths)}")
     print(f"  Avg events per session: {session_lengths.mean():.2f}")
     print(f"  Longest session: {session_lengths.max()} events")
@@ -79,7 +126,43 @@ def session_based_analysis():
 # Example 3: Process Discovery with Single Algorithm
 # ============================================================
 
-def discover_with_inductive_miner():
+def _event_log_fingerprint(event_log_df):
+    """
+    Hash of the case and activity sequence of an event log from
+    create_event_log(): the integer codes plus their labels, and the pm4py
+    version that produced the model.
+    """
+    digest = hashlib.blake2b(pm4py.__version__.encode(), digest_size=16)
+    for column in ('case_id', 'activity'):
+        values = event_log_df[column].astype('category')
+        digest.update(values.cat.codes.to_numpy().astype(np.int64).tobytes())
+        digest.update('\0'.join(map(str, values.cat.categories)).encode())
+    return digest.hexdigest()
+
+
+def discover_inductive_cached(event_log_df, cache_dir=CACHE_DIR):
+    """
+    Run discover_process_inductive_miner() on an event log, reusing the
+    pickled (tree, net, initial_marking, final_marking) from an earlier run
+    on the same log.
+    """
+    cache_path = os.path.join(cache_dir, f"im_{_event_log_fingerprint(event_log_df)}.pkl")
+    if os.path.exists(cache_path):
+        with open(cache_path, 'rb') as f:
+            result = pickle.load(f)
+        print(f"\n✓ Loaded cached Inductive Miner model from: {cache_path}")
+        return result
+    
+    # The miner takes the DataFrame directly; no pm4py EventLog is built
+    result = discover_process_inductive_miner(event_log_df)
+    if result[0] is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return result
+
+
+def discover_with_inductive_miner(df=None):
     """
     Focus on just the Inductive Miner for process discovery.
     Best choice for noisy smart home data.
@@ -88,13 +171,11 @@ def discover_with_inductive_miner():
     print("-" * 60)
     
     # Load and prepare data
-    df = load_aruba_data('aruba.csv', sample_size=30000)
-    df_clean = preprocess_data(df, remove_duplicates=True)
+    df_clean = get_prepped(30000, remove_duplicates=True, df=df)
     event_log_df = create_event_log(df_clean, case_strategy='daily')
-    event_log = convert_to_pm4py_log(event_log_df)
     
-    # Discover process model
-    tree, net, im, fm = discover_process_inductive_miner(event_log)
+    # Discover process model (cached on disk per event log)
+    tree, net, im, fm = discover_inductive_cached(event_log_df)
     
     # Visualize
     visualize_petri_net(net, im, fm, 
@@ -108,7 +189,7 @@ def discover_with_inductive_miner():
 # Example 4: Analyze Specific Sensors
 # ============================================================
 
-def analyze_specific_sensors():
+def analyze_specific_sensors(df=None):
     """
     Analyze activity patterns for specific sensors/rooms only.
     """
@@ -116,11 +197,15 @@ def analyze_specific_sensors():
     print("-" * 60)
     
     # Load data
-    df = load_aruba_data('aruba.csv', sample_size=50000)
+    df = load_aruba_data('aruba.csv', sample_size=50000) if df is None else df.head(50000)
     
     # Filter for specific sensors (example: bedroom-related sensors)
     print("\nFiltering for bedroom-related sensors...")
-    bedroom_sensors = df[df['sensor_id'].str.contains('Bedroom', case=False, na=False)]
+    # Match the substring against the distinct sensor names only and select
+    # rows by their category codes
+    sensor_names = df['sensor_id'].cat.categories
+    bedroom_codes = np.flatnonzero(sensor_names.str.contains('Bedroom', case=False, na=False))
+    bedroom_sensors = df[np.isin(df['sensor_id'].cat.codes.to_numpy(), bedroom_codes)]
     
     print(f"Events with 'Bedroom' sensors: {len(bedroom_sensors):,}")
     
@@ -137,7 +222,7 @@ def analyze_specific_sensors():
 # Example 5: Custom Activity Definition
 # ============================================================
 
-def custom_activity_definition():
+def custom_activity_definition(df=None):
     """
     Create custom activity labels instead of using sensor_id + value.
     For example, group all ON events as "Activate" and OFF as "Deactivate".
@@ -146,14 +231,18 @@ def custom_activity_definition():
     print("-" * 60)
     
     # Load and preprocess
-    df = load_aruba_data('aruba.csv', sample_size=10000)
-    df_clean = preprocess_data(df, remove_duplicates=False)  # Keep all events
+    df_clean = get_prepped(10000, remove_duplicates=False, df=df)  # Keep all events
     
     # Custom activity: Use room name + simplified action
-    df_clean['custom_activity'] = df_clean.apply(
-        lambda row: f"{row['sensor_id']}_{'Activate' if row['sensor_value'] == 'ON' else 'Deactivate'}",
-        axis=1
-    )
+    # Only n_sensors x 2 labels exist: format them once from the sensor
+    # categories and combine the integer codes, without touching per-row strings
+    sensor_ids = df_clean['sensor_id'].cat
+    is_off = ~df_clean['is_on'].to_numpy()
+    labels = [f"{sensor}_{action}"
+              for sensor in sensor_ids.categories
+              for action in ('Activate', 'Deactivate')]
+    codes = sensor_ids.codes.to_numpy().astype(np.int64) * 2 + is_off
+    df_clean['custom_activity'] = pd.Categorical.from_codes(codes, labels).remove_unused_categories()
     
     # Create event log with custom activity
     event_log_df = create_event_log(df_clean, 
@@ -161,14 +250,15 @@ def custom_activity_definition():
                                     activity_column='custom_activity')
     
     print(f"\nCustom Activities (Top 10):")
-    print(event_log_df['activity'].value_counts().head(10))
+    for activity, count in top_counts(event_log_df['activity'], 10):
+        print(f"  {activity:30s}: {count:7,}")
 
 
 # ============================================================
 # Example 6: Time-Based Filtering
 # ============================================================
 
-def analyze_specific_timeframe():
+def analyze_specific_timeframe(df=None):
     """
     Analyze only events during specific time periods (e.g., daytime hours).
     """
@@ -176,12 +266,12 @@ def analyze_specific_timeframe():
     print("-" * 60)
     
     # Load data
-    df = load_aruba_data('aruba.csv', sample_size=50000)
-    df_clean = preprocess_data(df)
+    df_clean = get_prepped(50000, df=df)
     
     # Filter for daytime hours (8 AM to 8 PM)
-    df_clean['hour'] = pd.to_datetime(df_clean['timestamp']).dt.hour
-    daytime_df = df_clean[(df_clean['hour'] >= 8) & (df_clean['hour'] <= 20)]
+    # Hour of day straight from the datetime64 values, without adding a column
+    hours = (df_clean['timestamp'].to_numpy().astype('datetime64[h]').view('i8') % 24).astype(np.int8)
+    daytime_df = df_clean.iloc[np.flatnonzero((hours >= 8) & (hours <= 20))]
     
     print(f"\nDaytime events (8 AM - 8 PM): {len(daytime_df):,}")
     print(f"Percentage of total: {len(daytime_df) / len(df_clean) * 100:.2f}%")
@@ -197,29 +287,42 @@ def analyze_specific_timeframe():
 # Example 7: Export Event Log to CSV
 # ============================================================
 
-def export_event_log():
+def export_event_log(df=None, output_format='csv'):
     """
     Create and export event log to CSV for use in other tools.
+    
+    With output_format='parquet' the log is written as zstd-compressed
+    Parquet instead (requires pyarrow): much faster to write and read, and
+    the categorical case and activity columns stay dictionary-encoded on disk.
     """
     print("\nExample 7: Export Event Log")
     print("-" * 60)
     
     # Load and prepare
-    df = load_aruba_data('aruba.csv', sample_size=20000)
-    df_clean = preprocess_data(df)
+    df_clean = get_prepped(20000, df=df)
     event_log_df = create_event_log(df_clean, case_strategy='daily')
-    
-    # Export to CSV
-    output_file = 'aruba_event_log.csv'
-    event_log_df[['case_id', 'activity', 'timestamp']].to_csv(output_file, index=False)
+    export_df = event_log_df[['case_id', 'activity', 'timestamp']]
+    
+    if output_format == 'parquet':
+        output_file = 'aruba_event_log.parquet'
+        export_df.to_parquet(output_file, compression='zstd', engine='pyarrow', index=False)
+    elif output_format == 'csv':
+        output_file = 'aruba_event_log.csv'
+        export_df.to_csv(output_file, index=False)
+    else:
+        raise ValueError(f"Unknown output_format: {output_format}")
     
     print(f"\n✓ Event log exported to: {output_file}")
     print(f"  Columns: case_id, activity, timestamp")
     print(f"  Rows: {len(event_log_df):,}")
-    print(f"\nThis CSV can be imported into:")
-    print(f"  - ProM (process mining tool)")
-    print(f"  - Disco (Fluxicon)")
-    print(f"  - Other pm4py scripts")
+    if output_format == 'parquet':
+        print(f"\nThis Parquet file can be read back with pandas.read_parquet()")
+        print(f"or any other Arrow-based tool.")
+    else:
+        print(f"\nThis CSV can be imported into:")
+        print(f"  - ProM (process mining tool)")
+        print(f"  - Disco (Fluxicon)")
+        print(f"  - Other pm4py scripts")
 
 
 # ============================================================
@@ -257,20 +360,27 @@ def main():
         return
     elif choice == '0':
         print("\nRunning all examples...\n")
+        # Parse the largest sample once; every example takes its first rows.
+        # If that fails, the examples load on their own and report errors.
+        try:
+            df = load_aruba_data('aruba.csv', sample_size=max(EXAMPLE_SAMPLE_SIZES))
+        except Exception as e:
+            print(f"Error: {e}")
+            df = None
         for _, func in examples.values():
             try:
-                func()
+                func(df=df)
                 print("\n" + "=" * 60 + "\n")
             except Exception as e:
                 print(f"Error: {e}")
     elif choice in examples:
+        # A single example goes through get_prepped()'s caches
         description, func = examples[choice]
         print(f"\nRunning: {description}\n")
         try:
             func()
         except Exception as e:
             print(f"Error: {e}")
-            import traceback
             traceback.print_exc()
     else:
         print("Invalid choice!")